@@ -10,32 +10,32 @@ Usage:
 """
 
 import argparse
+import asyncio
+import atexit
+import base64
+import csv
+import itertools
 import json
 import logging
+import multiprocessing
 import os
+import queue
+import re
 import time
-from dataclasses import dataclass
-from logging.handlers import RotatingFileHandler
-from typing import Dict, List, Optional, Union
-
-import pandas as pd
-import smtplib
-from bs4 import BeautifulSoup
-from email.mime.application import MIMEApplication
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import pyarrow as pa
+import pyarrow.parquet as pq
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from selenium import webdriver
-from selenium.common.exceptions import (
-    NoSuchElementException, 
-    TimeoutException, 
-    WebDriverException
-)
-from selenium.webdriver import ActionChains
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.actions.wheel_input import ScrollOrigin
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.remote.webelement import WebElement
@@ -46,30 +46,303 @@ class ScrapingConfig:
     """Configuration class for scraping parameters."""
     username: str = ""
     password: str = ""
+    li_at_cookie: str = ""
     search_query: str = "Senior Data Scientist"
     search_url: str = 'https://www.linkedin.com/jobs/search-results/?f_TPR=r604800&keywords=%22senior%20data%20engineer%22&origin=JOBS_HOME_SEARCH_BUTTON'
+    search_urls: List[str] = field(default_factory=list)  # scraped in turn; empty means [search_url]
     total_pages: int = 100
     scroll_count: int = 15
-    scroll_step: int = 500
+    scroll_pause_ms: int = 400
     page_load_timeout: int = 60
     script_timeout: int = 30
-    implicit_wait: int = 10
+    implicit_wait: int = 0  # explicit waits poll faster than the driver's implicit wait
     element_wait_timeout: int = 15
     max_retries: int = 3
     retry_delay: int = 5
+    output_format: str = "parquet"
+    http_concurrency: int = 8
+    user_data_dir: str = os.path.expanduser("~/.linkedin-scraper-profile")
+    workers: int = 1
+    headless: bool = False
+    state_file: str = ""
+
+
+@dataclass(frozen=True)
+class CardLayout:
+    """CSS selectors for one variant of the job search results markup."""
+    card: str
+    title: str
+    company: str
+    location: str
+    link: str
+
+
+# Known results layouts, in probing order. LinkedIn A/B-tests its markup, so
+# the first layout whose card selector matches a page is used for the run.
+CARD_LAYOUTS = (
+    CardLayout(
+        card=".artdeco-entity-lockup",
+        title=".artdeco-entity-lockup__title",
+        company=".artdeco-entity-lockup__subtitle",
+        location=".artdeco-entity-lockup__caption",
+        link="a[href*='/jobs/view/']"
+    ),
+    CardLayout(
+        card=".job-card-container",
+        title=".job-card-list__title",
+        company=".job-card-container__primary-description, .job-card-container__company-name",
+        location=".job-card-container__metadata-item",
+        link="a.job-card-container__link, a[href*='/jobs/view/']"
+    ),
+)
+
+# Matches a card from any known layout, used until the layout has been detected
+ANY_CARD_SELECTOR = ", ".join(layout.card for layout in CARD_LAYOUTS)
+
+# Server-rendered cards returned by the guest search API
+GUEST_CARD_LAYOUT = CardLayout(
+    card=".base-card",
+    title=".base-search-card__title",
+    company=".base-search-card__subtitle",
+    location=".job-search-card__location",
+    link="a.base-card__full-link"
+)
+
+
+# Columns of the output file; every row records the search and results page it came from
+OUTPUT_SCHEMA = pa.schema([
+    ('Search', pa.string()),
+    ('Page', pa.int32()),
+    ('Job Title', pa.string()),
+    ('Company Name', pa.string()),
+    ('Location', pa.string()),
+    ('Link', pa.string())
+])
+
+
+class JobDataWriter:
+    """Appends pages of job data to a single CSV, Parquet or Feather file."""
+    
+    def __init__(self, filename: str, output_format: str):
+        self.filename = filename
+        self.output_format = output_format
+        
+        if output_format == 'csv':
+            # Large userspace buffer so per-page writes coalesce into few syscalls
+            self._file = open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+            self._csv_writer = csv.writer(self._file)
+            self._csv_writer.writerow(OUTPUT_SCHEMA.names)
+        elif output_format == 'feather':
+            self._arrow_writer = pa.ipc.new_file(
+                filename, OUTPUT_SCHEMA, options=pa.ipc.IpcWriteOptions(compression='zstd')
+            )
+        else:
+            self._arrow_writer = pq.ParquetWriter(filename, OUTPUT_SCHEMA, compression='zstd')
+
+    def write_page(self, page_data: Dict[str, List[str]], page_num: int, search: str) -> None:
+        """Append the rows scraped from one results page of a search."""
+        if self.output_format == 'csv':
+            self._csv_writer.writerows(
+                zip(itertools.repeat(search), itertools.repeat(page_num),
+                    *(page_data[name] for name in OUTPUT_SCHEMA.names[2:]))
+            )
+        else:
+            rows = len(page_data['Link'])
+            table = pa.Table.from_pydict(
+                {'Search': [search] * rows, 'Page': [page_num] * rows, **page_data},
+                schema=OUTPUT_SCHEMA
+            )
+            self._arrow_writer.write_table(table)
+
+    def sync(self) -> bool:
+        """Force the rows written so far onto disk.
+        
+        Returns False for Parquet and Feather, whose files only become readable
+        once the footer is written by close().
+        """
+        if self.output_format != 'csv':
+            return False
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return True
+
+    def close(self) -> None:
+        """Flush buffered rows and finalize the file."""
+        if self.output_format == 'csv':
+            self._file.close()
+        else:
+            self._arrow_writer.close()
+
+
+def _closest_anchor(node: LexborNode) -> Optional[LexborNode]:
+    """Return the nearest enclosing <a> element of a parsed node."""
+    while node is not None and node.tag != "a":
+        node = node.parent
+    return node
+
+
+def _node_text(node: LexborNode) -> str:
+    """Return a node's text with runs of whitespace collapsed to single spaces."""
+    return " ".join(node.text().split())
+
+
+def _canonical_job_link(url: str) -> str:
+    """Drop tracking parameters so the same job always has the same link."""
+    parts = urlsplit(url)
+    job_id = dict(parse_qsl(parts.query)).get("currentJobId")
+    if job_id:
+        return urlunsplit((parts.scheme, parts.netloc, f"/jobs/view/{job_id}/", "", ""))
+    return urlunsplit(parts._replace(query="", fragment=""))
+
+
+JOB_ID_PATTERN = re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)")
+
+
+def job_id_from_link(link: str) -> str:
+    """Return the LinkedIn job id in a job link, or the link itself if it has none."""
+    match = JOB_ID_PATTERN.search(link)
+    return match.group(1) if match else link
+
+
+def parse_job_cards(html: str, layout: CardLayout) -> Dict[str, List[str]]:
+    """Extract title, company, location and link from every card in one pass."""
+    data: Dict[str, List[str]] = {'Job Title': [], 'Company Name': [], 'Location': [], 'Link': []}
+    
+    for card in LexborHTMLParser(html).css(layout.card):
+        title_elem = card.css_first(layout.title)
+        company_elem = card.css_first(layout.company)
+        location_elem = card.css_first(layout.location)
+        # Some guest cards are themselves the <a> rather than containing a link
+        link_elem = card.css_first(layout.link) or _closest_anchor(card)
+        href = link_elem.attributes.get("href") if link_elem else None
+        if not (title_elem and company_elem and location_elem and href):
+            continue
+            
+        data['Job Title'].append(_node_text(title_elem))
+        data['Company Name'].append(_node_text(company_elem))
+        data['Location'].append(_node_text(location_elem))
+        data['Link'].append(_canonical_job_link(href))
+        
+    return data
+
+
+def parse_guest_job_cards(html: str) -> Dict[str, List[str]]:
+    """Extract job data from a guest search API response."""
+    return parse_job_cards(html, GUEST_CARD_LAYOUT)
 
 
 class LinkedInScraper:
     """Main scraper class for LinkedIn job postings."""
     
+    RESULTS_PER_PAGE = 25
+    
+    # (pid, scraper) whose logging pipeline currently feeds the shared logger
+    _logging_owner: Optional[Tuple[int, "LinkedInScraper"]] = None
+    
+    # Seconds between explicit wait checks; WebDriverWait defaults to 0.5
+    _WAIT_POLL_FREQUENCY = 0.1
+    
+    # Login form locators
+    _SEL_USERNAME = (By.ID, "username")
+    _SEL_PASSWORD = (By.ID, "password")
+    _SEL_SUBMIT = (By.CSS_SELECTOR, "button[type='submit']")
+    _CSS_CHALLENGE = (
+        "[class*='verification'], [class*='challenge'], input[name='pin'], "
+        "#captcha-internal, #captcha-challenge, form#challenge"
+    )
+    
+    # Any of these signals means the login landed on an authenticated page
+    _LOGIN_SUCCESS = EC.any_of(
+        EC.url_contains("/feed"),
+        EC.url_contains("/in/"),
+        EC.presence_of_element_located((By.CSS_SELECTOR, "[data-test-id='nav-top-secondary']"))
+    )
+    
+    # Pagination button selectors, formatted with the target page number
+    _PAGE_BTN_SELECTORS = (
+        'button[aria-label="Page {page}"]',
+        'li[data-test-pagination-page-btn="{page}"] button',
+        'button[data-test-pagination-page-btn="{page}"]'
+    )
+    
+    # Resources the scraper never reads; blocked at the network layer via CDP
+    _BLOCKED_URL_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.woff*", "*.mp4", "*.css",
+        "*doubleclick*", "*google-analytics*"
+    ]
+    
+    # Scrolls the last job card into view until no new cards load.
+    # Arguments: card selector, max rounds, pause in ms, async callback.
+    _SCROLL_SCRIPT = """
+        const [cardSelector, maxRounds, pauseMs, done] = arguments;
+        const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+        (async () => {
+            let last = document.querySelectorAll(cardSelector).length;
+            for (let i = 0; i < maxRounds; i++) {
+                const cards = document.querySelectorAll(cardSelector);
+                if (cards.length) {
+                    cards[cards.length - 1].scrollIntoView();
+                } else {
+                    window.scrollBy(0, 2000);
+                }
+                await sleep(pauseMs);
+                const count = document.querySelectorAll(cardSelector).length;
+                if (count === last) break;
+                last = count;
+            }
+            done(last);
+        })();
+    """
+    
+    # Returns [title, company, location, href] for every job card in one round
+    # trip. Arguments: card, title, company, location and link selectors.
+    # Screen-reader-only copies (e.g. "<title> with verification") are left out.
+    _CARD_FIELDS_SCRIPT = """
+        const [cardSel, titleSel, companySel, locationSel, linkSel] = arguments;
+        const text = (card, sel) => {
+            const el = card.querySelector(sel);
+            if (!el) return null;
+            const copy = el.cloneNode(true);
+            copy.querySelectorAll('.visually-hidden').forEach(hidden => hidden.remove());
+            return copy.textContent.replace(/\\s+/g, ' ').trim();
+        };
+        return Array.from(document.querySelectorAll(cardSel)).map(card => {
+            const link = card.querySelector(linkSel) || card.closest('a');
+            return [
+                text(card, titleSel),
+                text(card, companySel),
+                text(card, locationSel),
+                link ? link.href : null
+            ];
+        });
+    """
+    
     def __init__(self, config: ScrapingConfig):
         self.config = config
         self.driver: Optional[webdriver.Chrome] = None
         self.data_list: List[Dict[str, List[str]]] = []
+        self._seen_job_ids: Set[str] = set()
+        # Ids whose rows reached the output file; only these are checkpointed
+        self._saved_job_ids: Set[str] = set()
+        self._waits: Dict[int, WebDriverWait] = {}
+        self._layout: Optional[CardLayout] = None
+        self._writer: Optional[JobDataWriter] = None
+        self._write_pool: Optional[ThreadPoolExecutor] = None
         self.logger = self._setup_logging()
+        self._load_state()
         
     def _setup_logging(self) -> logging.Logger:
         """Set up logging configuration."""
+        self._log_listener: Optional[QueueListener] = None
+        logger = logging.getLogger(__name__)
+        
+        if _worker_log_queue is not None:
+            # Pool workers send records to the parent rather than rotating the log file themselves
+            logger.setLevel(logging.DEBUG)
+            logger.handlers.clear()
+            logger.addHandler(QueueHandler(_worker_log_queue))
+            return logger
+            
         logs_dir = 'logs'
         os.makedirs(logs_dir, exist_ok=True)
 
@@ -94,12 +367,33 @@ class LinkedInScraper:
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
 
+        # Batch file writes; errors and shutdown flush the buffer immediately
+        file_buffer = MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=file_handler
+        )
+        file_buffer.setLevel(logging.DEBUG)
+
+        # The logger is shared by every scraper in this process; shut down the
+        # previous owner's listener thread and log file instead of stacking them
+        previous_owner = LinkedInScraper._logging_owner
+        if previous_owner is not None and previous_owner[0] == os.getpid():
+            previous_owner[1]._stop_logging()
+
+        # Hand records to a background listener so file/console I/O stays off
+        # the scraping path
+        log_queue: queue.Queue = queue.Queue(-1)
+        self._log_listener = QueueListener(
+            log_queue, file_buffer, console_handler, respect_handler_level=True
+        )
+        self._log_handlers = (file_buffer, file_handler)
+        self._log_listener.start()
+        atexit.register(self._stop_logging)
+        LinkedInScraper._logging_owner = (os.getpid(), self)
+
         # Configure logger
-        logger = logging.getLogger(__name__)
         logger.setLevel(logging.DEBUG)
         logger.handlers.clear()
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        logger.addHandler(QueueHandler(log_queue))
 
         # Log session start
         logger.info("="*60)
@@ -109,6 +403,17 @@ class LinkedInScraper:
         
         return logger
 
+    def _stop_logging(self) -> None:
+        """Drain queued log records, flush buffered ones and close the log file."""
+        if self._log_listener is None:
+            return
+            
+        atexit.unregister(self._stop_logging)
+        self._log_listener.stop()
+        self._log_listener = None
+        for handler in self._log_handlers:
+            handler.close()
+
     def _create_driver(self) -> webdriver.Chrome:
         """Create and configure Chrome WebDriver."""
         chrome_options = Options()
@@ -122,16 +427,28 @@ class LinkedInScraper:
             "--disable-features=VizDisplayCompositor",
             "--disable-extensions",
             "--disable-plugins",
-            "--disable-images",
-            "--page-load-strategy=eager",
             "--memory-pressure-off",
             "--max_old_space_size=4096",
             "--aggressive-cache-discard",
-            "--timeout=30000"
+            "--timeout=30000",
+            "--disable-blink-features=AutomationControlled",
+            "--blink-settings=imagesEnabled=false"
         ]
         
         for option in performance_options:
             chrome_options.add_argument(option)
+            
+        if self.config.headless:
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--window-size=1920,1080")
+            
+        # Return from driver.get() at DOMContentLoaded instead of full load;
+        # the explicit waits below cover anything rendered afterwards
+        chrome_options.page_load_strategy = "eager"
+            
+        # Persist cookies between runs so a warm profile can skip login
+        if self.config.user_data_dir:
+            chrome_options.add_argument(f"--user-data-dir={self.config.user_data_dir}")
         
         try:
             driver = webdriver.Chrome(options=chrome_options)
@@ -140,6 +457,11 @@ class LinkedInScraper:
             driver.implicitly_wait(self.config.implicit_wait)
             driver.maximize_window()
             
+            # Block images, fonts, media, stylesheets and trackers but keep the cache
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self._BLOCKED_URL_PATTERNS})
+            driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+            
             self.logger.info("Chrome WebDriver created successfully")
             return driver
             
@@ -147,6 +469,15 @@ class LinkedInScraper:
             self.logger.error(f"Failed to create Chrome WebDriver: {e}")
             raise
 
+    def _wait(self, timeout: int) -> WebDriverWait:
+        """Return a cached WebDriverWait for the current driver and timeout."""
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(
+                self.driver, timeout, poll_frequency=self._WAIT_POLL_FREQUENCY
+            )
+        return wait
+
     def _safe_find_element(self, by: By, value: str, timeout: Optional[int] = None, 
                           description: str = "") -> Optional[WebElement]:
         """Safely find an element with error handling."""
@@ -158,7 +489,7 @@ class LinkedInScraper:
         
         try:
             self.logger.debug(f"Finding element: {description}")
-            element = WebDriverWait(self.driver, timeout).until(
+            element = self._wait(timeout).until(
                 EC.presence_of_element_located((by, value))  # type: ignore
             )
             self.logger.debug(f"Found element: {description}")
@@ -178,7 +509,7 @@ class LinkedInScraper:
             
         try:
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(1)
+            self._wait(self.config.element_wait_timeout).until(EC.element_to_be_clickable(element))
             element.click()
             self.logger.debug(f"Clicked: {description}")
             return True
@@ -186,6 +517,17 @@ class LinkedInScraper:
             self.logger.error(f"Error clicking {description}: {e}")
             return False
 
+    def _save_screenshot(self, path: str) -> None:
+        """Save a JPEG screenshot via CDP, which encodes much faster than PNG."""
+        if not self.driver:
+            return
+            
+        screenshot = self.driver.execute_cdp_cmd(
+            "Page.captureScreenshot", {"format": "jpeg", "quality": 60}
+        )
+        with open(path, 'wb') as f:
+            f.write(base64.b64decode(screenshot["data"]))
+
     def _validate_credentials(self) -> bool:
         """Validate that credentials are provided."""
         if not self.config.username or not self.config.password:
@@ -193,58 +535,74 @@ class LinkedInScraper:
             return False
         return True
 
+    def _inject_cookies(self, cookies: List[Dict]) -> None:
+        """Add session cookies to the browser."""
+        # Cookies can only be set for the domain currently loaded
+        self.driver.get("https://www.linkedin.com")
+        for cookie in cookies:
+            self.driver.add_cookie(cookie)
+
     def login(self) -> bool:
         """Perform login to LinkedIn."""
         if not self.driver:
             self.logger.error("Driver not initialized")
             return False
             
+        try:
+            if self.config.li_at_cookie:
+                self._inject_cookies([
+                    {"name": "li_at", "value": self.config.li_at_cookie, "domain": ".linkedin.com"}
+                ])
+                
+            # A persisted or injected session lands on the feed instead of redirecting to login
+            self.driver.get("https://www.linkedin.com/feed/")
+            if "/feed" in self.driver.current_url:
+                self.logger.info("Reusing existing LinkedIn session")
+                return True
+        except Exception as e:
+            self.logger.debug(f"Session check failed: {e}")
+            
         if not self._validate_credentials():
             return False
             
         try:
             self.driver.get("https://www.linkedin.com/login")
-            time.sleep(2)
             
             # Enter username
-            username_field = self._safe_find_element(By.ID, "username", description="username field")
+            username_field = self._safe_find_element(*self._SEL_USERNAME, description="username field")
             if not username_field:
                 return False
                 
             username_field.clear()
-            time.sleep(0.5)
             username_field.send_keys(self.config.username)
             
             # Enter password
-            password_field = self.driver.find_element(By.ID, "password")
+            password_field = self.driver.find_element(*self._SEL_PASSWORD)
             password_field.clear()
-            time.sleep(0.5)
             password_field.send_keys(self.config.password)
             
-            time.sleep(1)
-            
             # Click login button
-            login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
+            login_button = self._wait(self.config.element_wait_timeout).until(
+                EC.element_to_be_clickable(self._SEL_SUBMIT)
+            )
             login_button.click()
             
             # Wait for login success
             try:
-                WebDriverWait(self.driver, 15).until(
-                    lambda d: any([
-                        "/feed" in d.current_url,
-                        "/in/" in d.current_url,
-                        "linkedin.com/feed" in d.current_url,
-                        d.find_elements(By.CSS_SELECTOR, "[data-test-id='nav-top-secondary']")
-                    ])
-                )
+                self._wait(15).until(self._LOGIN_SUCCESS)
                 self.logger.info("Successfully logged into LinkedIn")
                 return True
                 
             except Exception:
                 current_url = self.driver.current_url
-                page_source = self.driver.page_source.lower()
                 
-                if "challenge" in current_url or "verification" in page_source:
+                # Query the DOM in-browser rather than shipping page_source across
+                # the wire; querySelector also skips the implicit wait on no match
+                challenge_shown = self.driver.execute_script(
+                    "return document.querySelector(arguments[0]) !== null;", self._CSS_CHALLENGE
+                )
+                
+                if "challenge" in current_url or challenge_shown:
                     self.logger.error("Login blocked - security challenge detected")
                 elif "login" in current_url:
                     self.logger.error("Login failed - still on login page")
@@ -261,49 +619,79 @@ class LinkedInScraper:
         if page_num == 1:
             return True
             
-        # Try multiple selectors for pagination
-        selectors = [
-            f'button[aria-label="Page {page_num}"]',
-            f'li[data-test-pagination-page-btn="{page_num}"] button',
-            f'button[data-test-pagination-page-btn="{page_num}"]'
-        ]
+        # Remember the current first card so we can tell when the results re-render
+        old_cards = self.driver.find_elements(By.CSS_SELECTOR, self._card_selector) if self.driver else []
         
-        for selector in selectors:
-            page_button = self._safe_find_element(
-                By.CSS_SELECTOR, selector, timeout=10,
-                description=f"Page {page_num} button"
-            )
-            if page_button and self._safe_click_element(page_button, f"Page {page_num}"):
-                self.logger.info(f"Navigated to page {page_num}")
-                time.sleep(15)
-                return True
+        # Match any of the pagination selectors with one compound CSS selector, so a
+        # missing button costs a single timeout rather than one per selector
+        selector = ", ".join(template.format(page=page_num) for template in self._PAGE_BTN_SELECTORS)
+        page_button = self._safe_find_element(
+            By.CSS_SELECTOR, selector, timeout=10,
+            description=f"Page {page_num} button"
+        )
+        if page_button and self._safe_click_element(page_button, f"Page {page_num}"):
+            self.logger.info(f"Navigated to page {page_num}")
+            if old_cards:
+                try:
+                    self._wait(20).until(EC.staleness_of(old_cards[0]))
+                except TimeoutException:
+                    self.logger.warning(f"Results did not refresh after clicking page {page_num}")
+            self._wait_for_job_cards()
+            return True
         
         self.logger.warning(f"Could not navigate to page {page_num}")
         return False
 
+    def _wait_for_job_cards(self) -> bool:
+        """Wait until at least one job card is present on the page."""
+        if not self.driver:
+            return False
+            
+        try:
+            self._wait(self.config.element_wait_timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, self._card_selector))  # type: ignore
+            )
+            return True
+        except TimeoutException:
+            self.logger.warning("Timeout waiting for job cards")
+            return False
+
+    @property
+    def _card_selector(self) -> str:
+        """CSS selector for job cards in the detected layout, or any known layout."""
+        return self._layout.card if self._layout else ANY_CARD_SELECTOR
+
+    def _detect_layout(self) -> Optional[CardLayout]:
+        """Probe the loaded results page once to find which card layout it uses."""
+        if not self.driver:
+            return None
+            
+        index = self.driver.execute_script(
+            "return arguments[0].findIndex(sel => document.querySelector(sel) !== null);",
+            [layout.card for layout in CARD_LAYOUTS]
+        )
+        if index is None or index < 0:
+            self.logger.warning("No known job card layout detected")
+            return None
+            
+        self.logger.info(f"Detected job card layout: {CARD_LAYOUTS[index].card}")
+        return CARD_LAYOUTS[index]
+
     def _scroll_page(self) -> None:
         """Scroll through the page to load all job listings."""
         if not self.driver:
             return
             
         try:
-            # Find scroll container
-            footer = self.driver.find_element(By.XPATH, '//div[contains(@class, "search-results")]')
-            scroll_origin = ScrollOrigin.from_element(footer)
-            
-            # Perform scrolling
-            for i in range(self.config.scroll_count):
-                try:
-                    ActionChains(self.driver).scroll_from_origin(
-                        scroll_origin, 0, i * self.config.scroll_step
-                    ).perform()
-                    time.sleep(2)
-                except Exception as e:
-                    self.logger.warning(f"Scroll error at step {i}: {e}")
-                    break
-                    
-        except NoSuchElementException:
-            self.logger.warning("No scroll container found, skipping scrolling")
+            # Scroll in-browser until the card count stops growing: one round-trip
+            # instead of an ActionChains call plus a fixed sleep per step
+            card_count = self.driver.execute_async_script(
+                self._SCROLL_SCRIPT, self._card_selector,
+                self.config.scroll_count, self.config.scroll_pause_ms
+            )
+            self.logger.debug(f"Scrolling finished with {card_count} job cards loaded")
+        except Exception as e:
+            self.logger.warning(f"Scroll error: {e}")
 
     def _extract_job_data(self) -> Dict[str, List[str]]:
         """Extract job data from current page."""
@@ -314,47 +702,111 @@ class LinkedInScraper:
         
         try:
             # Wait for job elements to load
-            WebDriverWait(self.driver, self.config.element_wait_timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".artdeco-entity-lockup"))  # type: ignore
+            self._wait(self.config.element_wait_timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, self._card_selector))  # type: ignore
             )
             
-            job_elements = self.driver.find_elements(By.CSS_SELECTOR, ".artdeco-entity-lockup")
+            # Read every card's fields in a single script call instead of
+            # issuing several WebDriver round-trips per card
+            layout = self._layout or CARD_LAYOUTS[0]
+            records = self.driver.execute_script(
+                self._CARD_FIELDS_SCRIPT,
+                layout.card, layout.title, layout.company, layout.location, layout.link
+            )
             
-            for element in job_elements:
-                try:
-                    # Extract job information
-                    title_elem = element.find_element(By.CSS_SELECTOR, ".artdeco-entity-lockup__title")
-                    company_elem = element.find_element(By.CSS_SELECTOR, ".artdeco-entity-lockup__subtitle")
-                    location_elem = element.find_element(By.CSS_SELECTOR, ".artdeco-entity-lockup__caption")
-                    
-                    # Get job URL by clicking element
-                    current_url = self.driver.current_url
-                    element.click()
-                    time.sleep(2)
-                    job_url = self.driver.current_url
-                    
-                    # Store data
-                    data['Job Title'].append(title_elem.text.strip())
-                    data['Company Name'].append(company_elem.text.strip())
-                    data['Location'].append(location_elem.text.strip())
-                    data['Link'].append(job_url)
-                    
-                    # Navigate back if URL changed
-                    if job_url != current_url:
-                        self.driver.back()
-                        time.sleep(2)
-                        
-                except Exception as e:
-                    self.logger.debug(f"Error processing job element: {e}")
+            for title, company, location, href in records:
+                # Store data only once every field was found so columns stay aligned
+                if not (title and company and location and href):
                     continue
-                    
+                link = _canonical_job_link(href)
+                if job_id_from_link(link) in self._seen_job_ids:
+                    continue
+                data['Job Title'].append(title)
+                data['Company Name'].append(company)
+                data['Location'].append(location)
+                data['Link'].append(link)
+            
         except Exception as e:
             self.logger.error(f"Error extracting job data: {e}")
             
         return data
 
-    def _save_page_data(self, page_data: Dict[str, List[str]], page_num: int) -> None:
-        """Save data for a single page immediately to CSV."""
+    def _load_state(self) -> None:
+        """Prime the seen job ids from the state file of an earlier run, if any."""
+        state_file = self.config.state_file
+        if not state_file or not os.path.exists(state_file):
+            return
+        try:
+            with open(state_file, encoding='utf-8') as f:
+                state = json.load(f)
+            seen_job_ids = state.get('seen_job_ids') if isinstance(state, dict) else None
+            if not isinstance(seen_job_ids, list):
+                raise ValueError("expected an object with a 'seen_job_ids' list")
+            self._seen_job_ids.update(str(job_id) for job_id in seen_job_ids)
+            self._saved_job_ids.update(self._seen_job_ids)
+            self.logger.info(f"Loaded {len(self._seen_job_ids)} seen job ids from {state_file}")
+        except (OSError, ValueError, AttributeError, TypeError) as e:
+            self.logger.warning(f"Ignoring unreadable state file {state_file}: {e}")
+
+    def _save_state(self) -> None:
+        """Checkpoint the seen job ids so a restarted run skips jobs already scraped."""
+        if not self.config.state_file or self._write_pool is None:
+            return
+        self._write_pool.submit(self._checkpoint, self._writer)
+
+    def _checkpoint(self, writer: JobDataWriter) -> None:
+        """Write the state file on the writer thread, once the pages before it are on disk."""
+        try:
+            # Parquet and Feather rows are not durable until close, which writes the state then
+            if writer.sync():
+                self._write_state(list(self._saved_job_ids))
+        except OSError as e:
+            self.logger.warning(f"Could not sync {writer.filename}: {e}")
+
+    def _write_state(self, seen_job_ids: List[str]) -> None:
+        """Write the given job ids to the state file."""
+        state_file = self.config.state_file
+        try:
+            # Write to a temporary file first so a crash never leaves a truncated state
+            tmp_file = f"{state_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'seen_job_ids': sorted(seen_job_ids)}, f)
+            os.replace(tmp_file, state_file)
+        except OSError as e:
+            self.logger.warning(f"Could not save state to {state_file}: {e}")
+
+    def _drop_seen_rows(self, page_data: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Remove jobs already scraped on earlier pages, remembering the new ones."""
+        deduped: Dict[str, List[str]] = {column: [] for column in page_data}
+        
+        for row, link in zip(zip(*page_data.values()), page_data.get('Link', [])):
+            job_id = job_id_from_link(link)
+            if job_id in self._seen_job_ids:
+                continue
+            self._seen_job_ids.add(job_id)
+            for column, value in zip(deduped, row):
+                deduped[column].append(value)
+                
+        return deduped
+
+    def _output_filename(self) -> str:
+        """Pick the name of this run's output file."""
+        output_format = self.config.output_format
+        if not self.config.state_file:
+            return f'linkedin_data.{output_format}'
+            
+        # Runs with a state file each get their own file, so a resumed run never
+        # overwrites the jobs that the state file tells it to skip
+        stem = f"linkedin_data_{time.strftime('%Y%m%d-%H%M%S')}"
+        filename = f'{stem}.{output_format}'
+        for suffix in itertools.count(2):
+            if not os.path.exists(filename):
+                return filename
+            filename = f'{stem}-{suffix}.{output_format}'
+
+    def _save_page_data(self, page_data: Dict[str, List[str]], page_num: int, search: str) -> None:
+        """Append data for a single page to the run's output file."""
+        label = self._page_label(page_num, search)
         try:
             # Get minimum length to avoid index errors
             min_length = min(
@@ -365,48 +817,205 @@ class LinkedInScraper:
             )
             
             if min_length > 0:
-                df = pd.DataFrame(page_data)
-                csv_filename = f'linkedin_data_page_{page_num}.csv'
-                df.to_csv(csv_filename, index=False)
-                self.logger.info(f"Saved page {page_num} to {csv_filename} ({min_length} jobs)")
+                if self._writer is None:
+                    self._writer = JobDataWriter(self._output_filename(), self.config.output_format)
+                    # A single writer thread keeps pages in order and off the scraping path
+                    self._write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='output')
+                    
+                self._write_pool.submit(self._write_page, self._writer, page_data, page_num, search,
+                                        label, min_length)
             else:
-                self.logger.warning(f"No valid data to save for page {page_num}")
+                self.logger.warning(f"No valid data to save for {label}")
+                
+        except Exception as e:
+            self.logger.error(f"Error saving {label} data: {e}")
+
+    def _write_page(self, writer: JobDataWriter, page_data: Dict[str, List[str]],
+                    page_num: int, search: str, label: str, jobs: int) -> None:
+        """Write one page on the writer thread, logging instead of raising on failure."""
+        try:
+            writer.write_page(page_data, page_num, search)
+            self._saved_job_ids.update(job_id_from_link(link) for link in page_data['Link'])
+            self.logger.info(f"Saved {label} to {writer.filename} ({jobs} jobs)")
+        except Exception as e:
+            self.logger.error(f"Error saving {label} data: {e}")
+
+    def _close_output(self) -> None:
+        """Wait for pending writes, then flush and close the output file, if one was opened."""
+        if self._write_pool is not None:
+            self._write_pool.shutdown(wait=True)
+            self._write_pool = None
+        if self._writer is not None:
+            self._writer.close()
+            self.logger.info(f"Results written to {self._writer.filename}")
+            self._writer = None
+            if self.config.state_file:
+                self._write_state(list(self._saved_job_ids))
+
+    def _page_label(self, page_num: int, search: str) -> str:
+        """Name a results page in log messages, telling searches apart when there are several."""
+        searches = self._search_urls
+        if len(searches) > 1 and search in searches:
+            return f"search {searches.index(search) + 1} page {page_num}"
+        return f"page {page_num}"
+
+    def _record_page(self, page_data: Dict[str, List[str]], page_num: int, search: str) -> None:
+        """Deduplicate, log and save the jobs extracted from one page of a search."""
+        page_data = self._drop_seen_rows(page_data)
+        label = self._page_label(page_num, search)
+        
+        jobs_found = len(page_data.get('Job Title', []))
+        self.logger.info(f"{label.capitalize()}: {jobs_found} jobs found")
+        
+        if jobs_found > 0:
+            # Save page data immediately and don't keep it in memory
+            self._save_page_data(page_data, page_num, search)
+            self._save_state()
+        else:
+            self.logger.warning(f"No jobs found on {label}")
+
+    def _page_url(self, page_num: int) -> str:
+        """Build the search URL that opens a given results page directly."""
+        parts = urlsplit(self.config.search_url)
+        query = dict(parse_qsl(parts.query))
+        query['start'] = str((page_num - 1) * self.RESULTS_PER_PAGE)
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    def scrape_pages(self, page_nums: List[int],
+                     cookies: List[Dict]) -> Tuple[List[Tuple[int, Dict[str, List[str]]]], bool]:
+        """Scrape specific result pages in a fresh browser authenticated with cookies.
+        
+        Returns the pages scraped and whether the range finished without an error.
+        """
+        results: List[Tuple[int, Dict[str, List[str]]]] = []
+        ok = True
+        
+        try:
+            self.driver = self._create_driver()
+            self._waits.clear()
+            
+            self._inject_cookies(cookies)
+                
+            for page_num in page_nums:
+                self.logger.info(f"Processing page {page_num}/{self.config.total_pages}")
+                self.driver.get(self._page_url(page_num))
+                if not self._wait_for_job_cards():
+                    self.logger.warning(f"No results on page {page_num}, stopping this range")
+                    break
+                if not self._layout:
+                    self._layout = self._detect_layout()
+                    
+                self._scroll_page()
+                results.append((page_num, self._extract_job_data()))
                 
         except Exception as e:
-            self.logger.error(f"Error saving page {page_num} data: {e}")
+            self.logger.error(f"Scraping error in pages {page_nums[0]}-{page_nums[-1]}: {e}")
+            ok = False
+            
+        finally:
+            if self.driver:
+                self.driver.quit()
+                self.driver = None
+                
+        return results, ok
+
+    def _scrape_parallel(self) -> bool:
+        """Split the pages across worker processes that each own a browser.
+        
+        Returns False if any page range failed; the pages it did scrape are still saved.
+        """
+        if not self.driver:
+            return False
+            
+        # Share the logged-in session with the workers so they skip login
+        cookies = self.driver.get_cookies()
+        self.logger.info("Closing browser")
+        self.driver.quit()
+        self.driver = None
+        
+        pages = list(range(1, self.config.total_pages + 1))
+        chunk_size = -(-len(pages) // self.config.workers)
+        page_ranges = [pages[i:i + chunk_size] for i in range(0, len(pages), chunk_size)]
+        search_urls = self._search_urls
+        self.logger.info(f"Scraping {len(pages)} pages of {len(search_urls)} searches "
+                         f"with {self.config.workers} workers")
+        
+        # Feed worker log records into this process's pipeline so only it writes the log file
+        worker_log_queue = multiprocessing.Queue()
+        log_forwarder = QueueListener(worker_log_queue, *self.logger.handlers)
+        log_forwarder.start()
+        try:
+            return self._run_workers(cookies, page_ranges, worker_log_queue)
+        finally:
+            log_forwarder.stop()
+
+    def _run_workers(self, cookies: List[Dict], page_ranges: List[List[int]],
+                     worker_log_queue: multiprocessing.Queue) -> bool:
+        """Scrape each page range of each search in the process pool and record the results."""
+        with ProcessPoolExecutor(max_workers=self.config.workers, initializer=_init_worker_logging,
+                                 initargs=(worker_log_queue,)) as executor:
+            # Each task is one page range of one search, so searches run side by side too
+            futures = [
+                (search_url, executor.submit(scrape_page_range, replace(self.config, search_url=search_url),
+                                             page_range, cookies))
+                for search_url in self._search_urls
+                for page_range in page_ranges
+            ]
+            # Collect in page order so output and dedup match a serial run
+            all_ok = True
+            for search_url, future in futures:
+                try:
+                    results, ok = future.result()
+                except Exception as e:
+                    self.logger.error(f"Worker failed: {e}")
+                    results, ok = [], False
+                all_ok = all_ok and ok
+                for page_num, page_data in results:
+                    self._record_page(page_data, page_num, search_url)
+                    
+        return all_ok
+
+    @property
+    def _search_urls(self) -> List[str]:
+        """Search result URLs to scrape, in order."""
+        return self.config.search_urls or [self.config.search_url]
+
+    def _scrape_search(self, search_url: str) -> None:
+        """Scrape every page of one search in the current browser."""
+        self.logger.info(f"Navigating to: {search_url}")
+        self.driver.get(search_url)
+        self._layout = self._detect_layout() if self._wait_for_job_cards() else None
+        
+        for page_num in range(1, self.config.total_pages + 1):
+            self.logger.info(f"Processing page {page_num}/{self.config.total_pages}")
+            
+            if not self._navigate_to_page(page_num):
+                self.logger.warning(f"Stopping at page {page_num-1}")
+                break
+            
+            self._scroll_page()
+            self._record_page(self._extract_job_data(), page_num, search_url)
 
     def scrape(self) -> bool:
         """Main scraping method."""
         try:
             self.driver = self._create_driver()
+            self._waits.clear()
             
             if not self.login():
                 self.logger.error("Login failed, exiting")
                 return False
-            
-            self.logger.info(f"Navigating to: {self.config.search_url}")
-            self.driver.get(self.config.search_url)
-            time.sleep(3)
-            
-            # Scrape pages
-            for page_num in range(1, self.config.total_pages + 1):
-                self.logger.info(f"Processing page {page_num}/{self.config.total_pages}")
-                
-                if not self._navigate_to_page(page_num):
-                    self.logger.warning(f"Stopping at page {page_num-1}")
-                    break
-                
-                self._scroll_page()
-                page_data = self._extract_job_data()
-                
-                jobs_found = len(page_data.get('Job Title', []))
-                self.logger.info(f"Page {page_num}: {jobs_found} jobs found")
                 
-                if jobs_found > 0:
-                    # Save page data immediately and don't keep it in memory
-                    self._save_page_data(page_data, page_num)
-                else:
-                    self.logger.warning(f"No jobs found on page {page_num}")
+            if self.config.workers > 1:
+                if not self._scrape_parallel():
+                    self.logger.error("Scraping failed in one or more page ranges")
+                    return False
+                self.logger.info("Scraping completed successfully")
+                return True
+            
+            # One browser session serves every search, so login is paid once
+            for search_url in self._search_urls:
+                self._scrape_search(search_url)
             
             self.logger.info("Scraping completed successfully")
             return True
@@ -417,8 +1026,8 @@ class LinkedInScraper:
             # Save error screenshot
             if self.driver:
                 try:
-                    screenshot_path = f"error_screenshot_{int(time.time())}.png"
-                    self.driver.save_screenshot(screenshot_path)
+                    screenshot_path = f"error_screenshot_{int(time.time())}.jpg"
+                    self._save_screenshot(screenshot_path)
                     self.logger.info(f"Error screenshot saved: {screenshot_path}")
                 except Exception:
                     pass
@@ -426,11 +1035,127 @@ class LinkedInScraper:
             return False
             
         finally:
+            self._close_output()
             if self.driver:
                 self.logger.info("Closing browser")
                 self.driver.quit()
 
 
+# Set in process pool workers, whose log records are forwarded to the parent process
+_worker_log_queue: Optional[multiprocessing.Queue] = None
+
+
+def _init_worker_logging(log_queue: multiprocessing.Queue) -> None:
+    """Process pool initializer: route this worker's log records to the parent."""
+    global _worker_log_queue
+    _worker_log_queue = log_queue
+
+
+def scrape_page_range(config: ScrapingConfig, page_nums: List[int],
+                      cookies: List[Dict]) -> Tuple[List[Tuple[int, Dict[str, List[str]]]], bool]:
+    """Process pool entry point: scrape a range of pages in an independent browser."""
+    # Workers cannot share the persistent profile, which Chrome locks per process.
+    # Only the parent deduplicates and checkpoints, so workers skip the state file.
+    scraper = LinkedInScraper(replace(config, user_data_dir="", state_file=""))
+    try:
+        return scraper.scrape_pages(page_nums, cookies)
+    finally:
+        # Flush logs when called outside the pool; workers forward theirs to the parent
+        scraper._stop_logging()
+
+
+class GuestJobScraper(LinkedInScraper):
+    """Scraper for LinkedIn's public guest job search API, without a browser or login."""
+    
+    GUEST_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+    
+    # The guest API answers requests past the last page with these client errors
+    END_OF_RESULTS_STATUSES = (400, 404)
+    
+    # Upper bound in seconds on a server's Retry-After, so one page cannot stall a window for hours
+    MAX_RETRY_AFTER = 60
+    
+    async def _fetch_page(self, client: httpx.AsyncClient, page_num: int) -> Optional[str]:
+        """Fetch one page of guest search results, retrying failed requests."""
+        params = {
+            "keywords": self.config.search_query,
+            "start": (page_num - 1) * self.RESULTS_PER_PAGE
+        }
+        
+        for attempt in range(1, self.config.max_retries + 1):
+            try:
+                response = await client.get(self.GUEST_SEARCH_URL, params=params)
+                if response.status_code in self.END_OF_RESULTS_STATUSES:
+                    return ""
+                response.raise_for_status()
+                return response.text
+            except httpx.HTTPError as e:
+                self.logger.warning(f"Page {page_num} attempt {attempt} failed: {e}")
+                if not self._is_retryable(e):
+                    break
+                if attempt < self.config.max_retries:
+                    await asyncio.sleep(self._retry_delay(e, attempt))
+                    
+        self.logger.error(f"Giving up on page {page_num}")
+        return None
+
+    @staticmethod
+    def _is_retryable(error: httpx.HTTPError) -> bool:
+        """Whether a failed request may succeed later: network errors, 429 and 5xx."""
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            return status == 429 or status >= 500
+        return isinstance(error, httpx.TransportError)
+
+    def _retry_delay(self, error: httpx.HTTPError, attempt: int) -> float:
+        """Seconds to wait before retrying: a capped Retry-After on a 429, else exponential backoff."""
+        if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429:
+            retry_after = error.response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return float(min(int(retry_after), self.MAX_RETRY_AFTER))
+        return self.config.retry_delay * 2 ** (attempt - 1)
+
+    async def _scrape_all_pages(self) -> None:
+        """Fetch pages in concurrent windows, stopping after the window that runs out of results."""
+        headers = {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                                 "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"}
+        window = max(1, self.config.http_concurrency)
+        
+        async with httpx.AsyncClient(http2=True, headers=headers,
+                                     timeout=self.config.page_load_timeout) as client:
+            for first_page in range(1, self.config.total_pages + 1, window):
+                page_nums = range(first_page, min(first_page + window, self.config.total_pages + 1))
+                pages = await asyncio.gather(*(
+                    self._fetch_page(client, page_num) for page_num in page_nums
+                ))
+                
+                for page_num, html in zip(page_nums, pages):
+                    if html is None:
+                        continue
+                    if not html.strip():
+                        self.logger.info(f"No more results after page {page_num-1}")
+                        return
+                        
+                    self._record_page(parse_guest_job_cards(html), page_num, self.config.search_query)
+
+    def scrape(self) -> bool:
+        """Main scraping method."""
+        try:
+            self.logger.info(f"Fetching up to {self.config.total_pages} guest search pages "
+                             f"for '{self.config.search_query}'")
+            asyncio.run(self._scrape_all_pages())
+            
+            self.logger.info("Scraping completed successfully")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Scraping error: {e}")
+            return False
+            
+        finally:
+            self._close_output()
+
+
 def create_config_from_args(args: argparse.Namespace) -> ScrapingConfig:
     """Create configuration from command line arguments."""
     config = ScrapingConfig()
@@ -439,10 +1164,26 @@ def create_config_from_args(args: argparse.Namespace) -> ScrapingConfig:
         config.username = args.username
     if args.password:
         config.password = args.password
+    if args.li_at_cookie:
+        config.li_at_cookie = args.li_at_cookie
     if args.search_query:
         config.search_query = args.search_query
     if args.pages:
         config.total_pages = args.pages
+    if args.format:
+        config.output_format = args.format
+    if args.concurrency:
+        config.http_concurrency = args.concurrency
+    if args.profile_dir is not None:
+        config.user_data_dir = args.profile_dir
+    if args.workers:
+        config.workers = args.workers
+    if args.headless:
+        config.headless = True
+    if args.search_url:
+        config.search_urls = args.search_url
+    if args.state_file:
+        config.state_file = args.state_file
         
     return config
 
@@ -456,19 +1197,52 @@ def main():
 Examples:
   python linkedin_scraper.py --username user@example.com --password mypass
   python linkedin_scraper.py --username user@example.com --password mypass --pages 50
+  python linkedin_scraper.py --guest --search-query "Data Engineer" --pages 20
         """
     )
     
-    parser.add_argument('--username', required=True, help='LinkedIn username/email')
-    parser.add_argument('--password', required=True, help='LinkedIn password')
+    parser.add_argument('--username', default=os.environ.get('LINKEDIN_USERNAME'),
+                        help='LinkedIn username/email (default: $LINKEDIN_USERNAME)')
+    parser.add_argument('--password', default=os.environ.get('LINKEDIN_PASSWORD'),
+                        help='LinkedIn password (default: $LINKEDIN_PASSWORD)')
+    parser.add_argument('--li-at-cookie', default=os.environ.get('LINKEDIN_LI_AT'),
+                        help='li_at session cookie to log in with instead of the login form '
+                             '(default: $LINKEDIN_LI_AT)')
     parser.add_argument('--search-query', help='Job search query')
+    parser.add_argument('--search-url', action='append',
+                        help='LinkedIn job search results URL; repeat to scrape several searches '
+                             '(not with --guest, which searches --search-query)')
     parser.add_argument('--pages', type=int, default=100, help='Number of pages to scrape')
+    parser.add_argument('--format', choices=['csv', 'parquet', 'feather'], default='parquet',
+                        help='Output file format for per-page results')
+    parser.add_argument('--profile-dir',
+                        help='Chrome profile directory used to persist the login session '
+                             '(empty string disables it)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Browser processes to split the pages across (not with --guest)')
+    parser.add_argument('--headless', action='store_true',
+                        help='Run Chrome without a visible window (not with --guest)')
+    parser.add_argument('--state-file',
+                        help='JSON file of scraped job ids; jobs listed there are skipped '
+                             'and new ones are added after every page')
+    parser.add_argument('--guest', action='store_true',
+                        help='Use the public guest search API over HTTP instead of a logged-in browser')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Concurrent HTTP requests in --guest mode')
     
     args = parser.parse_args()
     
+    if not (args.guest or args.li_at_cookie or (args.username and args.password)):
+        parser.error('--username and --password (or LINKEDIN_USERNAME and LINKEDIN_PASSWORD) '
+                     'are required unless --li-at-cookie or --guest is used')
+    
+    if args.guest and (args.search_url or args.workers > 1 or args.headless):
+        parser.error('--search-url, --workers and --headless only apply to the browser scraper, '
+                     'not --guest')
+    
     # Create configuration and run scraper
     config = create_config_from_args(args)
-    scraper = LinkedInScraper(config)
+    scraper = GuestJobScraper(config) if args.guest else LinkedInScraper(config)
     
     success = scraper.scrape()
     exit(0 if success else 1)
@@ -0,0 +1,42 @@
+"""
+Core parsing logic for LinkedIn job search result pages.
+"""
+
+from typing import Dict, Iterator, List, NamedTuple
+
+from selectolax.lexbor import LexborHTMLParser
+
+# Job anchors of the cards on a search results page; company and other links are skipped
+JOB_LINK_SELECTOR = ".jobs-search-results__list-item a[href*='/jobs/view/']"
+
+
+class JobPosting(NamedTuple):
+    """A job posting parsed from a search results page."""
+    title: str
+    link: str
+
+
+def iter_job_postings(html: str) -> Iterator[JobPosting]:
+    """Yield job postings from the HTML of a job search results page.
+
+    A card can link to the same job more than once, for example from its logo
+    and its title, so each link is yielded once, with the first non-empty
+    title found for it. Links that never get a title are yielded last.
+    """
+    titles: Dict[str, str] = {}
+    for anchor in LexborHTMLParser(html).css(JOB_LINK_SELECTOR):
+        link = anchor.attributes["href"]
+        if titles.get(link):
+            continue
+        titles[link] = title = anchor.text(strip=True)
+        if title:
+            yield JobPosting(title=title, link=link)
+
+    for link, title in titles.items():
+        if not title:
+            yield JobPosting(title=title, link=link)
+
+
+def parse_job_postings(html: str) -> List[JobPosting]:
+    """Parse job postings from the HTML of a job search results page."""
+    return list(iter_job_postings(html))
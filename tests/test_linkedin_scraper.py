@@ -0,0 +1,288 @@
+import json
+import sys
+from pathlib import Path
+
+import httpx
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from linkedin_scraper import (  # noqa: E402
+    GuestJobScraper,
+    JobDataWriter,
+    LinkedInScraper,
+    ScrapingConfig,
+    job_id_from_link,
+    parse_guest_job_cards,
+)
+
+
+def test_parse_guest_job_cards() -> None:
+    """Verify guest search API cards are parsed with tracking params removed."""
+    sample_file = Path(__file__).parent / "data" / "sample_guest_jobs.html"
+    html = sample_file.read_text(encoding="utf-8")
+    data = parse_guest_job_cards(html)
+    assert data == {
+        'Job Title': ["Software Engineer", "Data Scientist"],
+        'Company Name': ["Acme Corp", "Globex"],
+        'Location': ["New York, NY", "Remote"],
+        'Link': [
+            "https://www.linkedin.com/jobs/view/software-engineer-12345",
+            "https://www.linkedin.com/jobs/view/data-scientist-67890",
+        ],
+    }
+
+
+def test_parse_guest_job_cards_link_on_card() -> None:
+    """Verify a guest card that is itself the job anchor still yields its link."""
+    html = """
+    <a class="base-card" href="https://www.linkedin.com/jobs/view/data-scientist-67890?trk=guest">
+      <h3 class="base-search-card__title">Data Scientist</h3>
+      <h4 class="base-search-card__subtitle">Globex</h4>
+      <span class="job-search-card__location">Remote</span>
+    </a>
+    """
+    assert parse_guest_job_cards(html)['Link'] == [
+        "https://www.linkedin.com/jobs/view/data-scientist-67890",
+    ]
+
+
+def test_extract_job_data_filters_card_records(tmp_path: Path, monkeypatch) -> None:
+    """Verify in-browser card records are canonicalized, incomplete and seen jobs skipped."""
+    monkeypatch.chdir(tmp_path)
+
+    class FakeDriver:
+        def find_element(self, by, value):
+            return object()
+
+        def execute_script(self, script, *args):
+            return [
+                ["Software Engineer", "Acme Corp", "New York, NY",
+                 "https://www.linkedin.com/jobs/search-results/?currentJobId=12345&trk=abc"],
+                ["No Company", None, "Remote", "https://www.linkedin.com/jobs/view/222/"],
+                ["Seen Before", "Initech", "Remote", "https://www.linkedin.com/jobs/view/333/?trk=x"],
+                ["Data Scientist", "Globex", "Remote", "https://www.linkedin.com/jobs/view/67890/?refId=y"],
+            ]
+
+    scraper = LinkedInScraper(ScrapingConfig())
+    scraper.driver = FakeDriver()
+    scraper._seen_job_ids.add("333")
+    assert scraper._extract_job_data() == {
+        'Job Title': ["Software Engineer", "Data Scientist"],
+        'Company Name': ["Acme Corp", "Globex"],
+        'Location': ["New York, NY", "Remote"],
+        'Link': [
+            "https://www.linkedin.com/jobs/view/12345/",
+            "https://www.linkedin.com/jobs/view/67890/",
+        ],
+    }
+
+
+def test_job_id_from_link() -> None:
+    """Verify the same job id is found in member and guest style links."""
+    assert job_id_from_link("https://www.linkedin.com/jobs/view/12345/") == "12345"
+    assert job_id_from_link("https://www.linkedin.com/jobs/view/data-scientist-at-acme-67890") == "67890"
+    assert job_id_from_link("https://example.com/careers/1") == "https://example.com/careers/1"
+
+
+def test_job_data_writer_appends_pages(tmp_path: Path) -> None:
+    """Verify pages are appended to one CSV file tagged with their search and page number."""
+    page_data = {
+        'Job Title': ["Software Engineer"],
+        'Company Name': ["Acme Corp"],
+        'Location': ["New York, NY"],
+        'Link': ["https://www.linkedin.com/jobs/view/12345"],
+    }
+    output_file = tmp_path / "linkedin_data.csv"
+    writer = JobDataWriter(str(output_file), "csv")
+    writer.write_page(page_data, 1, "python")
+    writer.write_page(page_data, 2, "python")
+    writer.write_page(page_data, 1, "rust")
+    writer.close()
+    assert output_file.read_text(encoding="utf-8").splitlines() == [
+        "Search,Page,Job Title,Company Name,Location,Link",
+        'python,1,Software Engineer,Acme Corp,"New York, NY",https://www.linkedin.com/jobs/view/12345',
+        'python,2,Software Engineer,Acme Corp,"New York, NY",https://www.linkedin.com/jobs/view/12345',
+        'rust,1,Software Engineer,Acme Corp,"New York, NY",https://www.linkedin.com/jobs/view/12345',
+    ]
+
+
+def test_job_data_writer_matches_csv_columns_by_name(tmp_path: Path) -> None:
+    """Verify CSV rows follow the schema even when page data lists columns in another order."""
+    output_file = tmp_path / "linkedin_data.csv"
+    writer = JobDataWriter(str(output_file), "csv")
+    writer.write_page({
+        'Link': ["https://www.linkedin.com/jobs/view/12345"],
+        'Location': ["Remote"],
+        'Company Name': ["Acme Corp"],
+        'Job Title': ["Software Engineer"],
+    }, 1, "python")
+    writer.close()
+    assert output_file.read_text(encoding="utf-8").splitlines()[1] == (
+        "python,1,Software Engineer,Acme Corp,Remote,https://www.linkedin.com/jobs/view/12345"
+    )
+
+
+def test_scrape_records_each_search(tmp_path: Path, monkeypatch) -> None:
+    """Verify several searches share one browser, tag rows with their search and dedup across them."""
+    monkeypatch.chdir(tmp_path)
+    jobs_by_search = {"https://example.com/search-a": ["1", "2"], "https://example.com/search-b": ["2", "3"]}
+
+    class FakeDriver:
+        current_url = ""
+
+        def get(self, url):
+            self.current_url = url
+
+        def quit(self):
+            pass
+
+    config = ScrapingConfig(output_format="csv", total_pages=1, user_data_dir="",
+                            search_urls=list(jobs_by_search))
+    scraper = LinkedInScraper(config)
+    driver = FakeDriver()
+    monkeypatch.setattr(scraper, "_create_driver", lambda: driver)
+    monkeypatch.setattr(scraper, "login", lambda: True)
+    monkeypatch.setattr(scraper, "_wait_for_job_cards", lambda: True)
+    monkeypatch.setattr(scraper, "_detect_layout", lambda: None)
+    monkeypatch.setattr(scraper, "_scroll_page", lambda: None)
+    monkeypatch.setattr(scraper, "_extract_job_data", lambda: {
+        'Job Title': [f"Job {job_id}" for job_id in jobs_by_search[driver.current_url]],
+        'Company Name': ["Acme Corp"] * 2,
+        'Location': ["Remote"] * 2,
+        'Link': [f"https://www.linkedin.com/jobs/view/{job_id}/" for job_id in jobs_by_search[driver.current_url]],
+    })
+
+    assert scraper.scrape()
+    assert (tmp_path / "linkedin_data.csv").read_text(encoding="utf-8").splitlines()[1:] == [
+        "https://example.com/search-a,1,Job 1,Acme Corp,Remote,https://www.linkedin.com/jobs/view/1/",
+        "https://example.com/search-a,1,Job 2,Acme Corp,Remote,https://www.linkedin.com/jobs/view/2/",
+        "https://example.com/search-b,1,Job 3,Acme Corp,Remote,https://www.linkedin.com/jobs/view/3/",
+    ]
+
+
+def test_state_file_resume_keeps_earlier_output(tmp_path: Path, monkeypatch) -> None:
+    """Verify a resumed run skips saved job ids without overwriting earlier results."""
+    monkeypatch.chdir(tmp_path)
+    config = ScrapingConfig(output_format="csv", state_file=str(tmp_path / "state.json"))
+
+    def page(*job_ids: str) -> dict:
+        return {
+            'Job Title': [f"Job {job_id}" for job_id in job_ids],
+            'Company Name': ["Acme Corp"] * len(job_ids),
+            'Location': ["Remote"] * len(job_ids),
+            'Link': [f"https://www.linkedin.com/jobs/view/{job_id}/" for job_id in job_ids],
+        }
+
+    first_run = LinkedInScraper(config)
+    first_run._record_page(page("1", "2"), 1, "python")
+    first_run._close_output()
+
+    resumed_run = LinkedInScraper(config)
+    resumed_run._record_page(page("2", "3"), 1, "python")
+    resumed_run._close_output()
+
+    outputs = tmp_path.glob("linkedin_data_*.csv")
+    assert sorted(path.read_text(encoding="utf-8").splitlines()[1:] for path in outputs) == [
+        ["python,1,Job 1,Acme Corp,Remote,https://www.linkedin.com/jobs/view/1/",
+         "python,1,Job 2,Acme Corp,Remote,https://www.linkedin.com/jobs/view/2/"],
+        ["python,1,Job 3,Acme Corp,Remote,https://www.linkedin.com/jobs/view/3/"],
+    ]
+
+
+def test_login_with_li_at_cookie_skips_form(tmp_path: Path, monkeypatch) -> None:
+    """Verify an li_at cookie is injected and a valid session never opens the login form."""
+    monkeypatch.chdir(tmp_path)
+
+    class FakeDriver:
+        def __init__(self):
+            self.current_url = ""
+            self.visited = []
+            self.cookies = []
+
+        def get(self, url):
+            self.visited.append(url)
+            self.current_url = url
+
+        def add_cookie(self, cookie):
+            self.cookies.append(cookie)
+
+    scraper = LinkedInScraper(ScrapingConfig(li_at_cookie="secret"))
+    scraper.driver = FakeDriver()
+    assert scraper.login()
+    assert scraper.driver.cookies == [{"name": "li_at", "value": "secret", "domain": ".linkedin.com"}]
+    assert scraper.driver.visited == ["https://www.linkedin.com", "https://www.linkedin.com/feed/"]
+
+
+def test_page_url_sets_start_offset(tmp_path: Path, monkeypatch) -> None:
+    """Verify result pages map to start offsets while other query parameters are kept."""
+    monkeypatch.chdir(tmp_path)
+    scraper = LinkedInScraper(ScrapingConfig(
+        search_url="https://www.linkedin.com/jobs/search/?keywords=python&start=999"
+    ))
+    assert scraper._page_url(1) == "https://www.linkedin.com/jobs/search/?keywords=python&start=0"
+    assert scraper._page_url(3) == "https://www.linkedin.com/jobs/search/?keywords=python&start=50"
+
+
+def test_scrape_pages_reports_failure(tmp_path: Path, monkeypatch) -> None:
+    """Verify a page range whose browser fails to start is reported as failed."""
+    monkeypatch.chdir(tmp_path)
+    scraper = LinkedInScraper(ScrapingConfig())
+
+    def broken_driver():
+        raise RuntimeError("chrome not found")
+
+    monkeypatch.setattr(scraper, "_create_driver", broken_driver)
+    assert scraper.scrape_pages([1, 2], []) == ([], False)
+
+
+def test_state_file_of_wrong_shape_is_ignored(tmp_path: Path, monkeypatch) -> None:
+    """Verify a state file holding valid JSON of the wrong shape does not stop the scraper."""
+    monkeypatch.chdir(tmp_path)
+    for content in ('["123"]', '{"seen_job_ids": 5}', 'not json'):
+        state_file = tmp_path / "state.json"
+        state_file.write_text(content, encoding="utf-8")
+        scraper = LinkedInScraper(ScrapingConfig(state_file=str(state_file)))
+        assert scraper._seen_job_ids == set()
+
+
+def test_state_file_skips_jobs_whose_write_failed(tmp_path: Path, monkeypatch) -> None:
+    """Verify a job whose page failed to write is left out of the state file."""
+    monkeypatch.chdir(tmp_path)
+    state_file = tmp_path / "state.json"
+    write_page = JobDataWriter.write_page
+
+    def failing_write_page(self, page_data, page_num, search):
+        if page_num == 2:
+            raise OSError("disk full")
+        write_page(self, page_data, page_num, search)
+
+    monkeypatch.setattr(JobDataWriter, "write_page", failing_write_page)
+    scraper = LinkedInScraper(ScrapingConfig(output_format="csv", state_file=str(state_file)))
+    for page_num in (1, 2):
+        scraper._record_page({
+            'Job Title': [f"Job {page_num}"],
+            'Company Name': ["Acme Corp"],
+            'Location': ["Remote"],
+            'Link': [f"https://www.linkedin.com/jobs/view/{page_num}/"],
+        }, page_num, "python")
+    scraper._close_output()
+
+    assert json.loads(state_file.read_text(encoding="utf-8")) == {'seen_job_ids': ["1"]}
+
+
+def test_guest_retry_delay(tmp_path: Path, monkeypatch) -> None:
+    """Verify guest retries honour a capped Retry-After on 429 and otherwise back off exponentially."""
+    monkeypatch.chdir(tmp_path)
+    scraper = GuestJobScraper(ScrapingConfig(retry_delay=5))
+
+    def status_error(status: int, headers: dict = None) -> httpx.HTTPStatusError:
+        request = httpx.Request("GET", GuestJobScraper.GUEST_SEARCH_URL)
+        response = httpx.Response(status, headers=headers, request=request)
+        return httpx.HTTPStatusError("error", request=request, response=response)
+
+    assert scraper._retry_delay(status_error(429, {"Retry-After": "7"}), 1) == 7
+    assert scraper._retry_delay(status_error(429, {"Retry-After": "86400"}), 1) == GuestJobScraper.MAX_RETRY_AFTER
+    assert [scraper._retry_delay(status_error(429), attempt) for attempt in (1, 2, 3)] == [5, 10, 20]
+    assert [scraper._retry_delay(status_error(503), attempt) for attempt in (1, 2, 3)] == [5, 10, 20]
+    assert not GuestJobScraper._is_retryable(status_error(403))
+    assert GuestJobScraper._is_retryable(httpx.ConnectError("refused"))
@@ -20,3 +20,46 @@ def test_parse_job_postings() -> None:
         title="Data Scientist",
         link="https://www.linkedin.com/jobs/view/67890",
     )
+
+
+def test_parse_job_postings_skips_duplicate_links() -> None:
+    """Verify a job linked more than once is only returned once."""
+    html = """
+    <li class="jobs-search-results__list-item">
+      <a href="https://www.linkedin.com/jobs/view/12345">Software Engineer</a>
+      <a href="https://www.linkedin.com/jobs/view/12345"><img alt="logo"></a>
+    </li>
+    """
+    assert parse_job_postings(html) == [
+        JobPosting(title="Software Engineer", link="https://www.linkedin.com/jobs/view/12345"),
+    ]
+
+
+def test_parse_job_postings_takes_title_after_logo_link() -> None:
+    """Verify a logo link before the title link does not leave the posting untitled."""
+    html = """
+    <li class="jobs-search-results__list-item">
+      <a href="https://www.linkedin.com/jobs/view/12345"><img alt="logo"></a>
+      <a href="https://www.linkedin.com/jobs/view/12345">Software Engineer</a>
+    </li>
+    <li class="jobs-search-results__list-item">
+      <a href="https://www.linkedin.com/jobs/view/67890"><img alt="logo"></a>
+    </li>
+    """
+    assert parse_job_postings(html) == [
+        JobPosting(title="Software Engineer", link="https://www.linkedin.com/jobs/view/12345"),
+        JobPosting(title="", link="https://www.linkedin.com/jobs/view/67890"),
+    ]
+
+
+def test_parse_job_postings_ignores_non_job_links() -> None:
+    """Verify company links inside a card are not returned as postings."""
+    html = """
+    <li class="jobs-search-results__list-item">
+      <a href="https://www.linkedin.com/jobs/view/12345">Software Engineer</a>
+      <a href="https://www.linkedin.com/company/acme">Acme</a>
+    </li>
+    """
+    assert parse_job_postings(html) == [
+        JobPosting(title="Software Engineer", link="https://www.linkedin.com/jobs/view/12345"),
+    ]